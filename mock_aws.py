@@ -1,11 +1,14 @@
 class MockAWS:
     def create_ec2(self, res):
-        print(f"🖥️  Launching EC2 instance '{res['Name']}' "
-              f"in region {res['Region']} with AMI {res['AMI']}")
+        name, region, ami = res['Name'], res['Region'], res['AMI']
+        print(f"🖥️  Launching EC2 instance '{name}' "
+              f"in region {region} with AMI {ami}")
 
     def create_s3(self, res):
-        print(f"🪣 Creating S3 bucket '{res['Name']}' "
-              f"in region {res['Region']} with encryption={res['Encryption']}")
+        name, region, enc = res['Name'], res['Region'], res['Encryption']
+        print(f"🪣 Creating S3 bucket '{name}' "
+              f"in region {region} with encryption={enc}")
 
     def create_iam(self, res):
-        print(f"🔐 Creating IAM role '{res['Name']}' with policy {res['Policy']}")
+        name, policy = res['Name'], res['Policy']
+        print(f"🔐 Creating IAM role '{name}' with policy {policy}")
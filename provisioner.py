@@ -4,26 +4,32 @@ Author: Dre Graham
 Purpose: Demonstrate how to provision AWS resources with Python and boto3-style logic
 """
 
-import json
 from datetime import datetime
 from mock_aws import MockAWS
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 def main():
     print("Starting AWS Provisioning Simulation...\n")
 
     # Load resource definitions
-    with open("resources.json", "r") as f:
-        resources = json.load(f)
+    with open("resources.json", "rb") as f:
+        resources = _json.loads(f.read())
 
     aws = MockAWS()
+    handlers = {
+        "EC2": aws.create_ec2,
+        "S3": aws.create_s3,
+        "IAM": aws.create_iam,
+    }
 
     for res in resources["Resources"]:
-        if res["Type"] == "EC2":
-            aws.create_ec2(res)
-        elif res["Type"] == "S3":
-            aws.create_s3(res)
-        elif res["Type"] == "IAM":
-            aws.create_iam(res)
+        handler = handlers.get(res["Type"])
+        if handler:
+            handler(res)
         else:
             print(f"⚠️ Unknown resource type: {res['Type']}")
 